@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Generic, Generator, TypeVar, NoReturn, Callable
+from dataclasses import dataclass, field
+from typing import Generic, Generator, TypeVar, NoReturn, Callable, Iterable, Iterator
 
 CommandType = TypeVar('CommandType')
 
@@ -27,3 +28,68 @@ def run_game(
                 input()
             )
         )
+
+
+class FinalStateMismatch(Exception):
+    def __init__(self, expected: str, actual: str) -> None:
+        super().__init__(f'expected final presentation {expected!r}, got {actual!r}')
+        self.expected = expected
+        self.actual = actual
+
+
+@dataclass(frozen=True)
+class HeadlessResult:
+    final_presentation: str
+    commands_played: int
+    ended: bool = False
+    samples: list[tuple[int, str]] = field(default_factory=list)
+
+
+def read_commands(
+    path: str,
+    command_parser: Callable[[str], CommandType],
+) -> Iterator[CommandType]:
+    with open(path) as command_file:
+        for line_number, line in enumerate(command_file, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                command = command_parser(line)
+            except (IndexError, KeyError, ValueError) as error:
+                raise ValueError(f'{path}:{line_number}: cannot parse command {line!r}') from error
+            yield command
+
+
+def run_headless(
+    game: Game[CommandType],
+    commands: Iterable[CommandType],
+    sample_every: int | None = None,
+    expected_final_presentation: str | None = None,
+) -> HeadlessResult:
+    if sample_every is not None and sample_every < 1:
+        raise ValueError(f'sample_every must be at least 1, got {sample_every}')
+
+    main_loop = game.main_loop()
+    presentation = next(main_loop)
+    samples = []
+    commands_played = 0
+    ended = False
+    for commands_played, command in enumerate(commands, 1):
+        try:
+            presentation = main_loop.send(command)
+        except StopIteration:
+            ended = True
+            break
+        if sample_every is not None and commands_played % sample_every == 0:
+            samples.append((commands_played, presentation))
+
+    if expected_final_presentation is not None and presentation != expected_final_presentation:
+        raise FinalStateMismatch(expected=expected_final_presentation, actual=presentation)
+
+    return HeadlessResult(
+        final_presentation=presentation,
+        commands_played=commands_played,
+        ended=ended,
+        samples=samples,
+    )
@@ -2,7 +2,8 @@ from typing import Callable
 
 import requests
 
-from try_something import Output, DrawInstructionType
+from http_io.serialization import serialize_frame
+from try_something import Output, DrawInstructionType, Frame, ResyncRequired
 
 
 class HttpOutput(Output):
@@ -17,3 +18,16 @@ class HttpOutput(Output):
     def draw(self, draw_instruction: DrawInstructionType) -> None:
         response = requests.post(self._url, json={'data': self._serialize_draw_instruction(draw_instruction)})
         response.raise_for_status()
+
+    def draw_frame(self, frame: Frame[DrawInstructionType]) -> None:
+        try:
+            response = requests.post(
+                self._url,
+                json=serialize_frame(frame, self._serialize_draw_instruction),
+            )
+        except requests.ConnectionError:
+            # the player will notice the gap once it is reachable again
+            return
+        if response.status_code == 409:
+            raise ResyncRequired(response.json()['last_sequence_number'])
+        response.raise_for_status()
@@ -3,9 +3,10 @@ import logging
 
 from flask import Flask, request
 
-from http_io.serialization import deserialize_draw_instruction
+from http_io.serialization import deserialize_draw_instruction, deserialize_frame
 from termios_io.factory import create_termios_io
 from termios_io.termios_output import TermiosOutput, TermiosDrawInstruction
+from try_something import FrameSequenceTracker, ResyncRequired
 
 
 def create_server(
@@ -15,11 +16,20 @@ def create_server(
     log = logging.getLogger('werkzeug')
     log.setLevel(logging.ERROR)
     app = Flask(__name__)
+    tracker = FrameSequenceTracker()
 
     @app.route('/draw', methods=['POST'])
     def draw():
-        draw_instruction = draw_instruction_deserializer(request.json['data'])
-        termios_output.draw(draw_instruction)
+        if 'sequence_number' not in request.json:
+            termios_output.draw(draw_instruction_deserializer(request.json['data']))
+            return 'ok'
+
+        frame = deserialize_frame(request.json, draw_instruction_deserializer)
+        try:
+            if tracker.accept(frame):
+                termios_output.draw(frame.draw_instruction)
+        except ResyncRequired as resync:
+            return {'last_sequence_number': resync.last_sequence_number}, 409
         return 'ok'
 
     return app
@@ -1,4 +1,7 @@
+from typing import Any, Callable
+
 from termios_io.termios_output import TermiosDrawInstruction, TermiosSymbol
+from try_something import Frame, DrawInstructionType
 
 
 def serialize_draw_instruction(draw_instruction: TermiosDrawInstruction) -> list[dict[str, str | int]]:
@@ -31,3 +34,25 @@ def deserialize_draw_instruction(raw: list[dict[str, int | str]]) -> TermiosDraw
             for symbol in raw
         ]
     )
+
+
+def serialize_frame(
+    frame: Frame[DrawInstructionType],
+    serialize_draw_instruction: Callable[[DrawInstructionType], list],
+) -> dict[str, Any]:
+    return {
+        'sequence_number': frame.sequence_number,
+        'keyframe': frame.keyframe,
+        'data': serialize_draw_instruction(frame.draw_instruction),
+    }
+
+
+def deserialize_frame(
+    raw: dict[str, Any],
+    deserialize_draw_instruction: Callable[[list], DrawInstructionType],
+) -> Frame[DrawInstructionType]:
+    return Frame(
+        sequence_number=raw['sequence_number'],
+        keyframe=raw['keyframe'],
+        draw_instruction=deserialize_draw_instruction(raw['data']),
+    )
@@ -0,0 +1,115 @@
+from typing import Generator
+
+import pytest
+
+from game import Game, run_headless, read_commands, FinalStateMismatch
+from tictactoe import TicTacToeBoard, parse_tic_tac_toe_command, replay_matches
+
+
+def test_run_headless_returns_final_presentation() -> None:
+    commands = map(parse_tic_tac_toe_command, ['00o', '10x', '11o'])
+
+    result = run_headless(TicTacToeBoard(), commands)
+
+    assert result.final_presentation == 'ox.\n.o.\n...'
+    assert result.commands_played == 3
+
+
+def test_run_headless_samples_intermediate_presentations() -> None:
+    commands = map(parse_tic_tac_toe_command, ['00o', '10x', '11o', '22x'])
+
+    result = run_headless(TicTacToeBoard(), commands, sample_every=2)
+
+    assert result.samples == [(2, 'ox.\n...\n...'), (4, 'ox.\n.o.\n..x')]
+
+
+def test_run_headless_checks_final_presentation() -> None:
+    commands = map(parse_tic_tac_toe_command, ['00o'])
+
+    with pytest.raises(FinalStateMismatch):
+        run_headless(TicTacToeBoard(), commands, expected_final_presentation='...\n...\n...')
+
+
+def test_read_commands_skips_blank_lines(tmp_path) -> None:
+    path = tmp_path / 'match.txt'
+    path.write_text('00o\n\n10x\n')
+
+    commands = list(read_commands(str(path), command_parser=parse_tic_tac_toe_command))
+
+    assert commands == [parse_tic_tac_toe_command('00o'), parse_tic_tac_toe_command('10x')]
+
+
+class ShortGame(Game[str]):
+    def main_loop(self) -> Generator[str, str, None]:
+        first = yield ''
+        yield first
+
+
+def test_run_headless_counts_command_that_ended_the_game() -> None:
+    result = run_headless(ShortGame(), ['a', 'b', 'c'])
+
+    assert result.commands_played == 2
+    assert result.ended
+    assert result.final_presentation == 'a'
+
+
+def test_run_headless_does_not_mark_unfinished_game_as_ended() -> None:
+    result = run_headless(ShortGame(), ['a'])
+
+    assert not result.ended
+
+
+def test_run_headless_rejects_sample_every_below_one() -> None:
+    with pytest.raises(ValueError):
+        run_headless(TicTacToeBoard(), [], sample_every=0)
+
+
+def test_read_commands_strips_carriage_returns(tmp_path) -> None:
+    path = tmp_path / 'match.txt'
+    path.write_bytes(b'00o\r\n  \r\n10x\r\n')
+
+    commands = list(read_commands(str(path), command_parser=parse_tic_tac_toe_command))
+
+    assert commands == [parse_tic_tac_toe_command('00o'), parse_tic_tac_toe_command('10x')]
+
+
+def test_read_commands_reports_path_and_line_of_bad_command(tmp_path) -> None:
+    path = tmp_path / 'match.txt'
+    path.write_text('00o\nx\n')
+
+    with pytest.raises(ValueError, match=f'{path}:2'):
+        list(read_commands(str(path), command_parser=parse_tic_tac_toe_command))
+
+
+def test_replay_matches_checks_expected_final_presentation(tmp_path) -> None:
+    passing = tmp_path / 'passing.txt'
+    passing.write_text('00o\n')
+    (tmp_path / 'passing.txt.expected').write_text('o..\n...\n...\n')
+    failing = tmp_path / 'failing.txt'
+    failing.write_text('00x\n')
+    (tmp_path / 'failing.txt.expected').write_text('o..\n...\n...\n')
+
+    assert replay_matches([str(passing)])
+    assert not replay_matches([str(passing), str(failing)])
+
+
+def test_replay_matches_continues_after_broken_match(tmp_path, capsys) -> None:
+    first = tmp_path / 'first.txt'
+    first.write_text('00o\n')
+    unparsable = tmp_path / 'unparsable.txt'
+    unparsable.write_text('0\n')
+    out_of_range = tmp_path / 'out_of_range.txt'
+    out_of_range.write_text('33x\n')
+    last = tmp_path / 'last.txt'
+    last.write_text('11x\n')
+
+    all_passed = replay_matches(
+        [str(first), str(unparsable), str(tmp_path / 'missing.txt'), str(out_of_range), str(last)]
+    )
+
+    output = capsys.readouterr().out
+    assert not all_passed
+    assert f'{unparsable}: ERROR' in output
+    assert f'{tmp_path / "missing.txt"}: ERROR' in output
+    assert f'{out_of_range}: ERROR' in output
+    assert f'{last}: played' in output
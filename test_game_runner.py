@@ -0,0 +1,275 @@
+from queue import Queue
+
+import pytest
+
+from try_something import CommandQueue, Frame, FrameBuffer, GameRunner, Game, Output, SequencedOutput, \
+    TickScheduler
+
+
+class CountingGame(Game[int, int]):
+    def __init__(self) -> None:
+        self._total = 0
+
+    def handle_command(self, command: int) -> int:
+        self._total += command
+        return self._total
+
+    def draw_full_screen(self) -> int:
+        return self._total
+
+
+class RecordingOutput(Output[int]):
+    def __init__(self) -> None:
+        self.drawn: list[int] = []
+
+    def draw(self, draw_instruction: int) -> None:
+        self.drawn.append(draw_instruction)
+
+
+class FlakyOutput(SequencedOutput[int]):
+    def __init__(self, output: Output[int]) -> None:
+        super().__init__(output)
+        self.connected = True
+
+    def draw_frame(self, frame: Frame[int]) -> None:
+        if self.connected:
+            super().draw_frame(frame)
+
+
+def create_runner(frame_buffer: FrameBuffer[int] | None = None) -> GameRunner[int, int]:
+    return GameRunner(
+        command_queue=CommandQueue(commands=Queue()),
+        game=CountingGame(),
+        frame_buffer=frame_buffer or FrameBuffer(),
+    )
+
+
+def play(runner: GameRunner[int, int], *commands: int) -> None:
+    for command in commands:
+        runner.command_queue.put(command)
+        runner.step()
+
+
+def test_frames_are_sequenced() -> None:
+    runner = create_runner()
+    play(runner, 1, 2, 3)
+
+    assert [frame.sequence_number for frame in runner.frame_buffer.frames_after(-1)] == [0, 1, 2]
+
+
+def test_late_subscriber_gets_full_screen() -> None:
+    runner = create_runner()
+    play(runner, 1, 2)
+    output = RecordingOutput()
+
+    runner.subscribe(SequencedOutput(output))
+    play(runner, 3)
+
+    assert output.drawn == [3, 6]
+
+
+def test_reconnecting_subscriber_replays_missed_frames() -> None:
+    runner = create_runner()
+    output = RecordingOutput()
+    flaky = FlakyOutput(output)
+    runner.subscribe(flaky)
+
+    play(runner, 1)
+    flaky.connected = False
+    play(runner, 2, 3)
+    flaky.connected = True
+    play(runner, 4)
+
+    assert output.drawn == [0, 1, 3, 6, 10]
+
+
+def test_subscriber_gets_full_screen_when_missed_frames_are_evicted() -> None:
+    runner = create_runner(FrameBuffer(capacity=2))
+    output = RecordingOutput()
+    flaky = FlakyOutput(output)
+    runner.subscribe(flaky)
+
+    flaky.connected = False
+    play(runner, 1, 2, 3)
+    flaky.connected = True
+    play(runner, 4)
+
+    assert output.drawn == [0, 10]
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test_tick_applies_queued_commands_and_publishes_one_frame() -> None:
+    runner = create_runner()
+    output = RecordingOutput()
+    runner.subscribe(output)
+
+    runner.command_queue.put(1)
+    runner.command_queue.put(2)
+    runner.tick(0.1)
+
+    assert output.drawn == [0, 3]
+
+
+def test_tick_scheduler_sleeps_until_next_deadline() -> None:
+    clock = FakeClock()
+    scheduler = TickScheduler(ticks_per_second=10, clock=clock, sleep=clock.sleep)
+
+    assert scheduler.wait() == 1
+    clock.now += 0.04
+    assert scheduler.wait() == 1
+
+    assert clock.now == pytest.approx(0.1)
+    assert scheduler.statistics.missed_deadlines == 0
+
+
+def test_tick_scheduler_catches_up_late_ticks() -> None:
+    clock = FakeClock()
+    scheduler = TickScheduler(ticks_per_second=10, clock=clock, sleep=clock.sleep)
+
+    scheduler.wait()
+    clock.now = 0.35
+
+    assert scheduler.wait() == 3
+    assert scheduler.statistics.missed_deadlines == 3
+    assert scheduler.statistics.max_lateness == pytest.approx(0.25)
+
+
+def test_tick_scheduler_counts_deadline_missed_by_less_than_a_tick() -> None:
+    clock = FakeClock()
+    scheduler = TickScheduler(ticks_per_second=10, clock=clock, sleep=clock.sleep)
+
+    scheduler.wait()
+    clock.now = 0.19
+
+    assert scheduler.wait() == 1
+    assert scheduler.statistics.missed_deadlines == 1
+
+
+def test_tick_scheduler_ignores_sleep_jitter() -> None:
+    clock = FakeClock()
+    scheduler = TickScheduler(ticks_per_second=10, clock=clock, sleep=clock.sleep)
+
+    scheduler.wait()
+    clock.now = 0.101
+
+    scheduler.wait()
+
+    assert scheduler.statistics.missed_deadlines == 0
+
+
+def test_tick_scheduler_mean_lateness_includes_catch_up_ticks() -> None:
+    clock = FakeClock()
+    scheduler = TickScheduler(ticks_per_second=10, clock=clock, sleep=clock.sleep)
+
+    scheduler.wait()
+    clock.now = 0.35
+    scheduler.wait()
+
+    assert scheduler.statistics.ticks == 4
+    assert scheduler.statistics.mean_lateness == pytest.approx((0.0 + 0.25 + 0.15 + 0.05) / 4)
+
+
+def test_tick_scheduler_drops_ticks_beyond_catch_up_limit() -> None:
+    clock = FakeClock()
+    scheduler = TickScheduler(ticks_per_second=10, max_catch_up_ticks=2, clock=clock, sleep=clock.sleep)
+
+    scheduler.wait()
+    clock.now = 1.05
+
+    assert scheduler.wait() == 3
+    assert scheduler.statistics.dropped_ticks == 7
+    assert scheduler.statistics.ticks == 4
+    assert scheduler.statistics.missed_deadlines == 3
+    assert scheduler.statistics.mean_lateness == pytest.approx((0.0 + 0.25 + 0.15 + 0.05) / 4)
+
+
+def test_tick_scheduler_keeps_schedule_after_dropping_ticks() -> None:
+    clock = FakeClock()
+    scheduler = TickScheduler(ticks_per_second=10, max_catch_up_ticks=2, clock=clock, sleep=clock.sleep)
+
+    scheduler.wait()
+    clock.now = 1.05
+    scheduler.wait()
+
+    assert scheduler.wait() == 1
+    assert clock.now == pytest.approx(1.1)
+    assert scheduler.statistics.missed_deadlines == 3
+
+
+class StopTicking(Exception):
+    pass
+
+
+class ScriptedTickScheduler(TickScheduler):
+    def __init__(self, clock: FakeClock, wake_up_times: list[float]) -> None:
+        super().__init__(ticks_per_second=10, clock=clock, sleep=clock.sleep)
+        self._fake_clock = clock
+        self._wake_up_times = wake_up_times
+
+    def wait(self) -> int:
+        if not self._wake_up_times:
+            raise StopTicking()
+        self._fake_clock.now = self._wake_up_times.pop(0)
+        return super().wait()
+
+
+class TickRecordingGame(CountingGame):
+    def __init__(self) -> None:
+        super().__init__()
+        self.ticks: list[float] = []
+
+    def tick(self, dt: float, command_draw_instructions: list[int]) -> int:
+        self.ticks.append(dt)
+        return super().tick(dt, command_draw_instructions)
+
+
+def test_run_ticks_runs_and_publishes_every_catch_up_tick() -> None:
+    game = TickRecordingGame()
+    runner = GameRunner(command_queue=CommandQueue(commands=Queue()), game=game)
+    output = RecordingOutput()
+    runner.subscribe(output)
+    scheduler = ScriptedTickScheduler(FakeClock(), wake_up_times=[0.0, 0.35])
+
+    with pytest.raises(StopTicking):
+        runner.run_ticks(scheduler)
+
+    assert game.ticks == pytest.approx([0.1] * 4)
+    assert len(output.drawn) == 1 + 4
+    assert runner.frame_buffer.last_sequence_number == 3
+
+
+class DeltaGame(Game[str, list[str]]):
+    def handle_command(self, command: str) -> list[str]:
+        return [command]
+
+    def draw_full_screen(self) -> list[str]:
+        return []
+
+    def tick(self, dt: float, command_draw_instructions: list[list[str]]) -> list[str]:
+        return [
+            change
+            for draw_instruction in command_draw_instructions
+            for change in draw_instruction
+        ] + ['tick']
+
+
+def test_tick_publishes_command_results_of_delta_game() -> None:
+    runner = GameRunner(command_queue=CommandQueue(commands=Queue()), game=DeltaGame())
+    output = RecordingOutput()
+    runner.subscribe(output)
+
+    runner.command_queue.put('left')
+    runner.command_queue.put('fire')
+    runner.tick(0.1)
+
+    assert output.drawn == [[], ['left', 'fire', 'tick']]
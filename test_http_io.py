@@ -0,0 +1,114 @@
+import pytest
+import requests
+
+from http_io.http_output import HttpOutput
+from http_io.player_server import create_server
+from http_io.serialization import serialize_draw_instruction, deserialize_draw_instruction, serialize_frame, \
+    deserialize_frame
+from termios_io.termios_output import TermiosDrawInstruction, TermiosSymbol, TermiosOutput
+from try_something import Frame, ResyncRequired
+
+
+def create_draw_instruction(to_draw: str) -> TermiosDrawInstruction:
+    return TermiosDrawInstruction([TermiosSymbol(x=1, y=1, to_draw=to_draw)])
+
+
+class RecordingTermiosOutput(TermiosOutput):
+    def __init__(self) -> None:
+        self.drawn: list[TermiosDrawInstruction] = []
+
+    def draw(self, draw_instruction: TermiosDrawInstruction) -> None:
+        self.drawn.append(draw_instruction)
+
+
+def create_client(output: RecordingTermiosOutput):
+    app = create_server(
+        draw_instruction_deserializer=deserialize_draw_instruction,
+        termios_output=output,
+    )
+    return app.test_client()
+
+
+def post_frame(client, frame: Frame[TermiosDrawInstruction]):
+    return client.post('/draw', json=serialize_frame(frame, serialize_draw_instruction))
+
+
+def test_frame_serialization_round_trip() -> None:
+    frame = Frame(sequence_number=3, draw_instruction=create_draw_instruction('x'), keyframe=True)
+
+    serialized = serialize_frame(frame, serialize_draw_instruction)
+
+    assert deserialize_frame(serialized, deserialize_draw_instruction) == frame
+
+
+def test_server_draws_legacy_payload_without_sequence_number() -> None:
+    output = RecordingTermiosOutput()
+    client = create_client(output)
+
+    response = client.post('/draw', json={'data': serialize_draw_instruction(create_draw_instruction('x'))})
+
+    assert response.status_code == 200
+    assert output.drawn == [create_draw_instruction('x')]
+
+
+def test_server_requests_keyframe_before_any_frame_was_drawn() -> None:
+    output = RecordingTermiosOutput()
+    client = create_client(output)
+
+    response = post_frame(client, Frame(sequence_number=4, draw_instruction=create_draw_instruction('x')))
+
+    assert response.status_code == 409
+    assert response.json == {'last_sequence_number': None}
+    assert output.drawn == []
+
+
+def test_server_reports_last_sequence_number_on_gap() -> None:
+    output = RecordingTermiosOutput()
+    client = create_client(output)
+    post_frame(client, Frame(sequence_number=1, draw_instruction=create_draw_instruction('x'), keyframe=True))
+    post_frame(client, Frame(sequence_number=2, draw_instruction=create_draw_instruction('o')))
+
+    response = post_frame(client, Frame(sequence_number=4, draw_instruction=create_draw_instruction('x')))
+
+    assert response.status_code == 409
+    assert response.json == {'last_sequence_number': 2}
+    assert output.drawn == [create_draw_instruction('x'), create_draw_instruction('o')]
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, body: dict | None = None) -> None:
+        self.status_code = status_code
+        self._body = body
+
+    def json(self) -> dict | None:
+        return self._body
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(str(self.status_code))
+
+
+def create_http_output() -> HttpOutput:
+    return HttpOutput(url='http://player:8080/draw', serialize_draw_instruction=serialize_draw_instruction)
+
+
+def test_http_output_raises_resync_required_on_conflict(monkeypatch) -> None:
+    monkeypatch.setattr(
+        requests,
+        'post',
+        lambda url, json: FakeResponse(409, {'last_sequence_number': None}),
+    )
+
+    with pytest.raises(ResyncRequired) as resync:
+        create_http_output().draw_frame(Frame(sequence_number=0, draw_instruction=create_draw_instruction('x')))
+
+    assert resync.value.last_sequence_number is None
+
+
+def test_http_output_drops_frame_when_player_is_unreachable(monkeypatch) -> None:
+    def post(url, json):
+        raise requests.ConnectionError()
+
+    monkeypatch.setattr(requests, 'post', post)
+
+    create_http_output().draw_frame(Frame(sequence_number=0, draw_instruction=create_draw_instruction('x')))
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import os
+import sys
+import time
 from dataclasses import dataclass
 from enum import auto, Enum
 from typing import Iterable, Generator
 
-from game import Game, run_game
+from game import Game, run_game, run_headless, read_commands, FinalStateMismatch
 
 
 @dataclass(frozen=True)
@@ -186,7 +189,39 @@ def print_board(board: str) -> None:
     print(board)
 
 
+def replay_matches(paths: list[str]) -> bool:
+    all_passed = True
+    for path in paths:
+        expected_path = f'{path}.expected'
+        expected_final_presentation = None
+        start = time.perf_counter()
+        try:
+            if os.path.exists(expected_path):
+                with open(expected_path) as expected_file:
+                    expected_final_presentation = expected_file.read().rstrip('\n')
+            result = run_headless(
+                game=TicTacToeBoard(),
+                commands=read_commands(path, command_parser=parse_tic_tac_toe_command),
+                expected_final_presentation=expected_final_presentation,
+            )
+        except FinalStateMismatch as mismatch:
+            print(f'{path}: FAILED, {mismatch}')
+            all_passed = False
+            continue
+        except Exception as error:
+            # malformed files and moves the game rejects must not stop the rest of the corpus
+            print(f'{path}: ERROR, {error!r}')
+            all_passed = False
+            continue
+        elapsed = time.perf_counter() - start
+
+        status = 'ok' if expected_final_presentation is not None else 'played'
+        print(f'{path}: {status}, {result.commands_played} commands in {elapsed:.4f}s')
+    return all_passed
+
 if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        sys.exit(0 if replay_matches(sys.argv[1:]) else 1)
     run_game(
         game=TicTacToeBoard(),
         print_game=print_board,
@@ -1,7 +1,9 @@
 import threading
+import time
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
-from queue import Queue
+from queue import Empty, Queue
 from typing import Callable, NoReturn, Generic, TypeVar
 
 from game import CommandType
@@ -21,6 +23,14 @@ class CommandQueue(Generic[CommandType]):
     def get(self) -> CommandType:
         return self.commands.get(block=True)
 
+    def get_all(self) -> list[CommandType]:
+        commands = []
+        while True:
+            try:
+                commands.append(self.commands.get_nowait())
+            except Empty:
+                return commands
+
 
 class InputReader(ABC, Generic[CommandType]):
     @abstractmethod
@@ -52,11 +62,89 @@ DrawInstructionType = TypeVar('DrawInstructionType')
 DrawInstruction = str
 
 
+@dataclass(frozen=True)
+class Frame(Generic[DrawInstructionType]):
+    sequence_number: int
+    draw_instruction: DrawInstructionType
+    keyframe: bool = False
+
+
+class ResyncRequired(Exception):
+    def __init__(self, last_sequence_number: int | None) -> None:
+        super().__init__(f'resync required after frame {last_sequence_number}')
+        self.last_sequence_number = last_sequence_number
+
+
 class Output(ABC, Generic[DrawInstructionType]):
     @abstractmethod
     def draw(self, draw_instruction: DrawInstructionType) -> None:
         pass
 
+    def draw_frame(self, frame: Frame[DrawInstructionType]) -> None:
+        self.draw(frame.draw_instruction)
+
+
+class FrameSequenceTracker:
+    def __init__(self) -> None:
+        self._last_sequence_number: int | None = None
+
+    @property
+    def last_sequence_number(self) -> int | None:
+        return self._last_sequence_number
+
+    def accept(self, frame: Frame) -> bool:
+        if frame.keyframe:
+            self._last_sequence_number = frame.sequence_number
+            return True
+        if self._last_sequence_number is None:
+            raise ResyncRequired(None)
+        if frame.sequence_number <= self._last_sequence_number:
+            return False
+        if frame.sequence_number != self._last_sequence_number + 1:
+            raise ResyncRequired(self._last_sequence_number)
+        self._last_sequence_number = frame.sequence_number
+        return True
+
+
+class SequencedOutput(Output[DrawInstructionType], Generic[DrawInstructionType]):
+    def __init__(self, output: Output[DrawInstructionType]) -> None:
+        self._output = output
+        self._tracker = FrameSequenceTracker()
+
+    def draw(self, draw_instruction: DrawInstructionType) -> None:
+        self._output.draw(draw_instruction)
+
+    def draw_frame(self, frame: Frame[DrawInstructionType]) -> None:
+        if self._tracker.accept(frame):
+            self._output.draw(frame.draw_instruction)
+
+
+class FrameBuffer(Generic[DrawInstructionType]):
+    def __init__(self, capacity: int = 64) -> None:
+        self._frames: deque[Frame[DrawInstructionType]] = deque(maxlen=capacity)
+        self._next_sequence_number = 0
+
+    @property
+    def last_sequence_number(self) -> int:
+        return self._next_sequence_number - 1
+
+    def append(self, draw_instruction: DrawInstructionType) -> Frame[DrawInstructionType]:
+        frame = Frame(sequence_number=self._next_sequence_number, draw_instruction=draw_instruction)
+        self._next_sequence_number += 1
+        self._frames.append(frame)
+        return frame
+
+    def frames_after(self, sequence_number: int) -> list[Frame[DrawInstructionType]] | None:
+        if sequence_number >= self.last_sequence_number:
+            return []
+        if not self._frames or sequence_number + 1 < self._frames[0].sequence_number:
+            return None
+        return [
+            frame
+            for frame in self._frames
+            if frame.sequence_number > sequence_number
+        ]
+
 
 class TerminalOutput(Output):
     def draw(self, draw_instruction: DrawInstructionType) -> None:
@@ -72,6 +160,78 @@ class Game(ABC, Generic[CommandType, DrawInstructionType]):
     def draw_full_screen(self) -> DrawInstructionType:
         pass
 
+    def tick(
+        self,
+        dt: float,
+        command_draw_instructions: list[DrawInstructionType],
+    ) -> DrawInstructionType:
+        """
+        Advance the game by dt seconds. The returned draw instruction is the
+        only frame published for this tick, so it must include
+        command_draw_instructions, the results of the commands applied since
+        the previous tick. The full screen covers them.
+        """
+        return self.draw_full_screen()
+
+
+@dataclass
+class TickStatistics:
+    ticks: int = 0
+    missed_deadlines: int = 0
+    dropped_ticks: int = 0
+    total_lateness: float = 0.0
+    max_lateness: float = 0.0
+
+    @property
+    def mean_lateness(self) -> float:
+        if self.ticks == 0:
+            return 0.0
+        return self.total_lateness / self.ticks
+
+
+class TickScheduler:
+    def __init__(
+        self,
+        ticks_per_second: float,
+        max_catch_up_ticks: int = 5,
+        jitter_tolerance: float = 0.002,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.dt = 1 / ticks_per_second
+        self.statistics = TickStatistics()
+        self._max_catch_up_ticks = max_catch_up_ticks
+        self._jitter_tolerance = jitter_tolerance
+        self._clock = clock
+        self._sleep = sleep
+        self._next_deadline: float | None = None
+
+    def wait(self) -> int:
+        now = self._clock()
+        if self._next_deadline is None:
+            self._next_deadline = now
+        if now < self._next_deadline:
+            self._sleep(self._next_deadline - now)
+            now = self._clock()
+
+        overdue = now - self._next_deadline
+        due = 1 + int(max(overdue, 0.0) // self.dt)
+        self._next_deadline += due * self.dt
+
+        dropped = max(due - 1 - self._max_catch_up_ticks, 0)
+        self.statistics.dropped_ticks += dropped
+        due -= dropped
+
+        # the oldest ticks are dropped, so the ticks that run are the most recent ones
+        for i in range(dropped, dropped + due):
+            tick_lateness = max(overdue - i * self.dt, 0.0)
+            if tick_lateness > self._jitter_tolerance:
+                self.statistics.missed_deadlines += 1
+            self.statistics.total_lateness += tick_lateness
+            self.statistics.max_lateness = max(self.statistics.max_lateness, tick_lateness)
+        self.statistics.ticks += due
+        return due
+
 
 @dataclass(frozen=True)
 class GameRunner(Generic[CommandType, DrawInstructionType]):
@@ -79,17 +239,67 @@ class GameRunner(Generic[CommandType, DrawInstructionType]):
     game: Game[CommandType, DrawInstructionType]
     controller_threads: list[threading.Thread] = field(default_factory=list)
     subscribers: list[Output[DrawInstructionType]] = field(default_factory=list)
+    frame_buffer: FrameBuffer[DrawInstructionType] = field(default_factory=FrameBuffer)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
 
     def run(self) -> NoReturn:
         while True:
-            command = self.command_queue.get()
-            draw_instruction = self.game.handle_command(command)
-            for subscriber in self.subscribers:
-                subscriber.draw(draw_instruction)
+            self.step()
+
+    def step(self) -> None:
+        command = self.command_queue.get()
+        with self._lock:
+            self._publish(self.game.handle_command(command))
+
+    def run_ticks(self, scheduler: TickScheduler) -> NoReturn:
+        while True:
+            for _ in range(scheduler.wait()):
+                self.tick(scheduler.dt)
+
+    def tick(self, dt: float) -> None:
+        with self._lock:
+            command_draw_instructions = [
+                self.game.handle_command(command)
+                for command in self.command_queue.get_all()
+            ]
+            self._publish(self.game.tick(dt, command_draw_instructions))
 
     def subscribe(self, subscriber: Output[DrawInstructionType]) -> None:
-        self.subscribers.append(subscriber)
-        subscriber.draw(self.game.draw_full_screen())
+        with self._lock:
+            self.subscribers.append(subscriber)
+            subscriber.draw_frame(self._keyframe())
+
+    def _publish(self, draw_instruction: DrawInstructionType) -> None:
+        frame = self.frame_buffer.append(draw_instruction)
+        for subscriber in self.subscribers:
+            try:
+                subscriber.draw_frame(frame)
+            except ResyncRequired as resync:
+                self._resync(subscriber, resync.last_sequence_number)
+
+    def _resync(
+        self,
+        subscriber: Output[DrawInstructionType],
+        last_sequence_number: int | None,
+    ) -> None:
+        missed_frames = None
+        if last_sequence_number is not None:
+            missed_frames = self.frame_buffer.frames_after(last_sequence_number)
+        if missed_frames is not None:
+            try:
+                for frame in missed_frames:
+                    subscriber.draw_frame(frame)
+                return
+            except ResyncRequired:
+                pass
+        subscriber.draw_frame(self._keyframe())
+
+    def _keyframe(self) -> Frame[DrawInstructionType]:
+        return Frame(
+            sequence_number=self.frame_buffer.last_sequence_number,
+            draw_instruction=self.game.draw_full_screen(),
+            keyframe=True,
+        )
 
     def add_controller(self, controller: Controller[CommandType]) -> None:
         thread = threading.Thread(target=controller.run)